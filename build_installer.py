@@ -16,15 +16,41 @@ Examples:
 
 import os
 import sys
+import errno
 import subprocess
 import argparse
 import shutil
 import json
+import hashlib
+import re
 import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import platform
 
+# Optional: batch file deletion through io_uring on Linux (pip install liburing)
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+URING_QUEUE_DEPTH = 128
+
+# Top-level files that feed `npm run build` (webpack.*.js is matched separately)
+BUILD_INPUT_FILES = {'package.json', 'package-lock.json', 'tsconfig.json', '.env'}
+# Variables webpack.renderer.config.js inlines via DefinePlugin; exported values win over .env
+BUILD_INPUT_ENV = (
+    'SUPABASE_URL', 'SUPABASE_ANON_KEY', 'GOOGLE_CLIENT_ID', 'GOOGLE_CLIENT_SECRET',
+    'GOOGLE_API_KEY', 'OPENAI_API_KEY', 'NODE_ENV'
+)
+
+INSTALLER_EXTENSIONS = ('.exe', '.dmg', '.deb', '.rpm', '.appimage', '.zip')
+# Packaged-app subtrees under out/ that never contain installers
+SKIPPED_ARTIFACT_DIRS = {'resources', 'locales'}
+
 class Colors:
     """Terminal color codes for better output formatting"""
     HEADER = '\033[95m'
@@ -43,7 +69,17 @@ class FlowGeniusBuilder:
         self.project_root = Path(__file__).parent
         self.package_json_path = self.project_root / "package.json"
         self.dist_path = self.project_root / "out"
+        self.build_stamp_path = self.dist_path / ".build-stamp"
         self.build_start_time = time.time()
+        self._log_lock = threading.Lock()
+        # Forge's package step rebuilds the shared .webpack/ directory
+        self._package_lock = threading.Lock()
+        self._ts_cache = (0, '')  # (epoch second, formatted timestamp)
+        self._important_re = re.compile(r'error|warning|success|complete', re.IGNORECASE)
+        
+        # Resolve npm once; npm.cmd is the Windows shim
+        self.npm = shutil.which('npm') or shutil.which('npm.cmd')
+        self.npm_version: Optional[str] = None
         
         # Load package.json for version info
         try:
@@ -55,8 +91,13 @@ class FlowGeniusBuilder:
     
     def log(self, message: str, color: str = Colors.OKBLUE):
         """Log a message with optional color"""
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"{color}[{timestamp}] {message}{Colors.ENDC}")
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        timestamp = self._ts_cache[1]
+        # Installers are built concurrently, so keep each line intact
+        with self._log_lock:
+            print(f"{color}[{timestamp}] {message}{Colors.ENDC}")
     
     def success(self, message: str):
         """Log a success message"""
@@ -74,52 +115,70 @@ class FlowGeniusBuilder:
         """Log an info message"""
         self.log(f"ℹ️  {message}", Colors.OKCYAN)
     
-    def run_command(self, command: List[str], description: str) -> bool:
-        """Run a command and return success status"""
+    def run_command(self, npm_args: List[str], description: str, quiet_failure: bool = False) -> bool:
+        """Run an npm command (e.g. ['run', 'build']) and return success status.
+        
+        With quiet_failure, a failing command returns False without the error report.
+        """
         self.info(f"Running: {description}")
+        if not self.npm:
+            self.error("npm not found. Make sure npm/yarn is installed and in PATH.")
+            return False
+        
+        command = [self.npm, *npm_args]
         if self.verbose:
             self.log(f"Command: {' '.join(command)}")
         
         try:
             if self.verbose:
                 # For verbose mode, show output in real-time
-                result = subprocess.run(
+                subprocess.run(
                     command,
                     cwd=self.project_root,
                     check=True,
-                    shell=True,
                     encoding='utf-8',
                     errors='ignore'  # Ignore encoding errors
                 )
             else:
-                # For non-verbose mode, capture output
-                result = subprocess.run(
+                # For non-verbose mode, filter the output as it streams in,
+                # keeping only a bounded tail for error diagnostics
+                important_lines = deque(maxlen=3)
+                output_tail = deque(maxlen=200)
+                with subprocess.Popen(
                     command,
                     cwd=self.project_root,
-                    check=True,
-                    capture_output=True,
-                    shell=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1,
                     encoding='utf-8',
                     errors='ignore'  # Ignore encoding errors
-                )
+                ) as proc:
+                    for line in proc.stdout:
+                        line = line.rstrip('\n')
+                        output_tail.append(line)
+                        if self._important_re.search(line):
+                            important_lines.append(line)
+                
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, command, output='\n'.join(output_tail))
                 
-                if result.stdout:
-                    # Only show important parts of stdout
-                    lines = result.stdout.split('\n')
-                    important_lines = [line for line in lines if any(keyword in line.lower() for keyword in ['error', 'warning', 'success', 'complete'])]
-                    if important_lines:
-                        for line in important_lines[-3:]:  # Show last 3 important lines
-                            print(line)
+                # Show last 3 important lines
+                with self._log_lock:
+                    for line in important_lines:
+                        print(line)
             
             self.success(f"Completed: {description}")
             return True
             
         except subprocess.CalledProcessError as e:
+            if quiet_failure:
+                return False
             self.error(f"Failed: {description}")
-            if hasattr(e, 'stdout') and e.stdout:
-                print(f"STDOUT: {e.stdout}")
-            if hasattr(e, 'stderr') and e.stderr:
-                print(f"STDERR: {e.stderr}")
+            with self._log_lock:
+                if e.stdout:
+                    print(f"STDOUT: {e.stdout}")
+                if e.stderr:
+                    print(f"STDERR: {e.stderr}")
             return False
         except FileNotFoundError:
             self.error(f"Command not found. Make sure npm/yarn is installed and in PATH.")
@@ -128,57 +187,74 @@ class FlowGeniusBuilder:
             self.error(f"Unexpected error running command: {e}")
             return False
     
-    def check_prerequisites(self) -> bool:
-        """Check if all prerequisites are met"""
+    def check_prerequisites(self, force_install: bool = False) -> bool:
+        """Check if all prerequisites are met, installing dependencies if needed"""
         self.info("Checking prerequisites...")
         
         # Check if Node.js/npm is available
-        npm_commands = ['npm', 'npm.cmd']  # Try both npm and npm.cmd (Windows)
-        npm_found = False
-        
-        for npm_cmd in npm_commands:
-            try:
-                result = subprocess.run([npm_cmd, '--version'], capture_output=True, text=True, check=True, shell=True)
-                npm_version = result.stdout.strip()
-                self.success(f"npm version: {npm_version} (using {npm_cmd})")
-                npm_found = True
-                break
-            except subprocess.CalledProcessError as e:
-                if self.verbose:
-                    self.error(f"{npm_cmd} command failed with exit code {e.returncode}")
-                    if e.stderr:
-                        self.error(f"STDERR: {e.stderr}")
-                continue
-            except FileNotFoundError:
-                if self.verbose:
-                    self.error(f"{npm_cmd} not found in PATH")
-                continue
-        
-        if not npm_found:
+        if not self.npm:
             self.error("npm not found. Please install Node.js and npm.")
             self.info("You can download Node.js (which includes npm) from: https://nodejs.org/")
             return False
         
+        if self.npm_version is None:
+            try:
+                result = subprocess.run([self.npm, '--version'], capture_output=True, text=True, check=True)
+                self.npm_version = result.stdout.strip()
+            except (subprocess.CalledProcessError, OSError) as e:
+                self.error(f"{self.npm} --version failed: {e}")
+                if self.verbose and getattr(e, 'stderr', None):
+                    self.error(f"STDERR: {e.stderr}")
+                return False
+        self.success(f"npm version: {self.npm_version} (using {self.npm})")
+        
         # Check if package.json exists
         if not self.package_json_path.exists():
             self.error("package.json not found")
             return False
         
-        # Check if node_modules exists
+        # Check if node_modules exists and matches package-lock.json
         node_modules = self.project_root / "node_modules"
         if not node_modules.exists():
             self.warning("node_modules not found. Will run npm install.")
-            return self.install_dependencies()
+        if not self.install_dependencies(force=force_install):
+            return False
         
         self.success("All prerequisites met")
         return True
     
-    def install_dependencies(self) -> bool:
-        """Install npm dependencies"""
-        return self.run_command(
-            ['npm', 'install'],
+    def _lockfile_hash(self) -> Optional[str]:
+        """Hash package-lock.json, or None if there is no lockfile"""
+        try:
+            with open(self.project_root / "package-lock.json", 'rb') as f:
+                return hashlib.blake2b(f.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+    
+    def install_dependencies(self, force: bool = False) -> bool:
+        """Install npm dependencies, skipping npm when package-lock.json is unchanged"""
+        install_stamp = self.project_root / "node_modules" / ".install-stamp"
+        lock_hash = self._lockfile_hash()
+        
+        if not force and lock_hash is not None:
+            try:
+                if install_stamp.read_text(encoding='utf-8').strip() == lock_hash:
+                    self.success("Dependencies up to date")
+                    return True
+            except OSError:
+                pass
+        
+        success = self.run_command(
+            ['install'],
             "Installing dependencies"
         )
+        
+        if success:
+            # npm install may rewrite the lockfile, so hash what is on disk now
+            lock_hash = self._lockfile_hash()
+            if lock_hash is not None and install_stamp.parent.is_dir():
+                install_stamp.write_text(lock_hash, encoding='utf-8')
+        return success
     
     def clean_build(self) -> bool:
         """Clean previous build artifacts"""
@@ -187,51 +263,203 @@ class FlowGeniusBuilder:
         directories_to_clean = [
             self.dist_path,
             self.project_root / "dist",
-            self.project_root / ".webpack",
-            self.project_root / "src" / "renderer" / "*.js",
-            self.project_root / "src" / "renderer" / "*.js.map"
+            self.project_root / ".webpack"
         ]
         
         for dir_path in directories_to_clean:
-            if dir_path.exists():
-                if dir_path.is_dir():
-                    shutil.rmtree(dir_path)
-                    self.success(f"Removed directory: {dir_path}")
-                else:
-                    # Handle file patterns
-                    parent_dir = dir_path.parent
-                    pattern = dir_path.name
-                    if '*' in pattern:
-                        import glob
-                        files = glob.glob(str(dir_path))
-                        for file in files:
-                            os.remove(file)
-                            self.success(f"Removed file: {file}")
+            if dir_path.is_dir():
+                try:
+                    self._remove_tree(dir_path)
+                except OSError as e:
+                    self.error(f"Failed to remove {dir_path}: {e}")
+                    return False
+                self.success(f"Removed directory: {dir_path}")
         
         return True
     
+    def _remove_tree(self, root: Path):
+        """Remove a directory tree, unlinking its files in parallel"""
+        files = []
+        directories = []
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            directories.append(current)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        
+        self._unlink_files(files)
+        
+        # Children were discovered after their parents, so remove in reverse
+        for directory in reversed(directories):
+            os.rmdir(directory)
+    
+    def _unlink_files(self, files: List[str]):
+        """Delete files, batching the unlinks through io_uring where available"""
+        if liburing is not None and sys.platform.startswith('linux'):
+            try:
+                ring = liburing.Ring()
+                liburing.io_uring_queue_init(
+                    URING_QUEUE_DEPTH, ring,
+                    liburing.IORING_SETUP_COOP_TASKRUN | liburing.IORING_SETUP_SINGLE_ISSUER
+                )
+            except (OSError, AttributeError) as e:
+                # Old kernel, io_uring disabled or an older binding; use the thread pool instead
+                if self.verbose:
+                    self.warning(f"io_uring unavailable ({e}), falling back to threads")
+            else:
+                try:
+                    self._uring_unlink(ring, files)
+                    return
+                except (TypeError, AttributeError) as e:
+                    # Binding API mismatch; finish the job with the thread pool
+                    if self.verbose:
+                        self.warning(f"io_uring unlink unusable ({e}), falling back to threads")
+                finally:
+                    liburing.io_uring_queue_exit(ring)
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            list(executor.map(self._unlink_if_exists, files))
+    
+    @staticmethod
+    def _unlink_if_exists(path: str):
+        """Unlink a file, ignoring one that is already gone"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    
+    def _uring_unlink(self, ring, files: List[str]):
+        """Unlink files through an initialized ring, one full queue at a time"""
+        cqe = liburing.Cqe()
+        use_bytes = None  # whether the binding wants bytes paths; decided by the first SQE
+        for start in range(0, len(files), URING_QUEUE_DEPTH):
+            batch = files[start:start + URING_QUEUE_DEPTH]
+            # The SQEs point into these path buffers, so keep them referenced until reaped
+            args = [os.fsencode(path) for path in batch] if use_bytes else batch
+            for index in range(len(batch)):
+                sqe = liburing.io_uring_get_sqe(ring)
+                if use_bytes is None:
+                    try:
+                        liburing.io_uring_prep_unlink(sqe, args[index])
+                        use_bytes = False
+                    except TypeError:
+                        # Bindings that take a raw `const char *` only accept bytes
+                        use_bytes = True
+                        args = [os.fsencode(path) for path in batch]
+                        liburing.io_uring_prep_unlink(sqe, args[index])
+                else:
+                    liburing.io_uring_prep_unlink(sqe, args[index])
+                liburing.io_uring_sqe_set_data64(sqe, index)
+            liburing.io_uring_submit_and_wait(ring, len(batch))
+            
+            # Reap the whole batch before refilling. A failed unlink comes back as a
+            # negative res; some binding versions raise OSError when res is read
+            # instead. ENOENT is fine, as on the thread-pool path
+            for _ in batch:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                entry = cqe[0]
+                path = batch[liburing.io_uring_cqe_get_data64(entry)]
+                try:
+                    res = entry.res
+                except OSError as e:
+                    res = -e.errno
+                liburing.io_uring_cqe_seen(ring, entry)
+                if res < 0 and -res != errno.ENOENT:
+                    raise OSError(-res, os.strerror(-res), path)
+            del args
+    
+    def _input_fingerprint(self) -> str:
+        """Hash the path, mtime and size of every build input, plus the inlined env vars"""
+        inputs = []
+        with os.scandir(self.project_root) as entries:
+            for entry in entries:
+                if entry.name in BUILD_INPUT_FILES or (
+                    entry.name.startswith('webpack.') and entry.name.endswith('.js')
+                ):
+                    inputs.append(entry)
+        
+        stack = [str(self.project_root / "src")]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        inputs.append(entry)
+        
+        records = []
+        for entry in inputs:
+            stat = entry.stat()
+            records.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        
+        digest = hashlib.blake2b()
+        for path, mtime_ns, size in sorted(records):
+            digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode('utf-8', 'surrogateescape'))
+        for name in BUILD_INPUT_ENV:
+            value = os.environ.get(name)
+            digest.update(f"{name}\0{'' if value is None else '=' + value}\n".encode('utf-8', 'surrogateescape'))
+        return digest.hexdigest()
+    
+    def _read_build_stamp(self) -> dict:
+        """Read out/.build-stamp, or an empty stamp if missing or unreadable"""
+        try:
+            with open(self.build_stamp_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_build_stamp(self, stamp: dict):
+        """Write out/.build-stamp"""
+        self.dist_path.mkdir(parents=True, exist_ok=True)
+        with open(self.build_stamp_path, 'w', encoding='utf-8') as f:
+            json.dump(stamp, f, indent=2)
+    
     def build_app(self) -> bool:
-        """Build the application"""
+        """Build the application, skipping it when no build input changed"""
         self.info("Building FlowGenius application...")
         
+        fingerprint = self._input_fingerprint()
+        stamp = self._read_build_stamp()
+        if stamp.get('fingerprint') == fingerprint and (self.project_root / "dist" / "main.js").exists():
+            self.success("Build inputs unchanged, skipping npm run build")
+            return True
+        
         # Run the build command
         success = self.run_command(
-            ['npm', 'run', 'build'],
+            ['run', 'build'],
             "Building application (Webpack + TypeScript)"
         )
         
         if success:
+            self._write_build_stamp({'fingerprint': fingerprint})
             self.success("Application build completed")
         return success
     
+    def _package_and_make(self, platform_flag: str, make_target: str, description: str,
+                          quiet_failure: bool = False) -> bool:
+        """Package the app for one platform, then run its makers on the packaged output"""
+        # Packaging recompiles .webpack/, so only one platform may package at a time;
+        # the makers read the packaged app under out/ and can run concurrently
+        with self._package_lock:
+            if not self.run_command(
+                ['run', 'package', '--', f'--platform={platform_flag}'],
+                f"Packaging application ({platform_flag})",
+                quiet_failure
+            ):
+                return False
+        
+        return self.run_command(['run', make_target, '--', '--skip-package'], description, quiet_failure)
+    
     def create_installer_windows(self) -> bool:
         """Create Windows installer"""
         self.info("Creating Windows installer...")
         
-        success = self.run_command(
-            ['npm', 'run', 'make:win'],
-            "Creating Windows installer (NSIS)"
-        )
+        success = self._package_and_make('win32', 'make:win', "Creating Windows installer (NSIS)")
         
         if success:
             self.success("Windows installer created")
@@ -239,21 +467,24 @@ class FlowGeniusBuilder:
         
         return success
     
-    def create_installer_macos(self) -> bool:
-        """Create macOS installer"""
+    def create_installer_macos(self, best_effort: bool = False) -> bool:
+        """Create macOS installer.
+        
+        With best_effort, a failure (e.g. on a non-Mac host) is reported as skipped.
+        """
         self.info("Creating macOS installer...")
         
-        if platform.system() != "Darwin":
+        if platform.system() != "Darwin" and not best_effort:
             self.warning("macOS builds should be created on macOS for best results")
         
-        success = self.run_command(
-            ['npm', 'run', 'make:mac'],
-            "Creating macOS installer (DMG)"
-        )
+        success = self._package_and_make('darwin', 'make:mac', "Creating macOS installer (DMG)",
+                                         quiet_failure=best_effort)
         
         if success:
             self.success("macOS installer created")
             self._show_build_artifacts("darwin")
+        elif best_effort:
+            self.info("macOS build skipped (requires macOS)")
         
         return success
     
@@ -261,10 +492,7 @@ class FlowGeniusBuilder:
         """Create Linux installer"""
         self.info("Creating Linux installer...")
         
-        success = self.run_command(
-            ['npm', 'run', 'make:linux'],
-            "Creating Linux installer (AppImage)"
-        )
+        success = self._package_and_make('linux', 'make:linux', "Creating Linux installer (AppImage)")
         
         if success:
             self.success("Linux installer created")
@@ -272,18 +500,74 @@ class FlowGeniusBuilder:
         
         return success
     
+    def create_installers(self, windows: bool = False, macos: bool = False, linux: bool = False,
+                          macos_best_effort: bool = False) -> Tuple[List[str], bool]:
+        """Create the requested installers in parallel.
+        
+        Returns the platforms that were built and whether all of them succeeded.
+        """
+        installer_jobs = []
+        if windows:
+            installer_jobs.append(("Windows", self.create_installer_windows))
+        if macos:
+            installer_jobs.append(("macOS", lambda: self.create_installer_macos(best_effort=macos_best_effort)))
+        if linux:
+            installer_jobs.append(("Linux", self.create_installer_linux))
+        
+        platforms_built = []
+        overall_success = True
+        if not installer_jobs:
+            return platforms_built, overall_success
+        
+        # Packaging is serialized inside each job; the makers run in parallel
+        with ThreadPoolExecutor(max_workers=len(installer_jobs)) as executor:
+            futures = [(name, executor.submit(job)) for name, job in installer_jobs]
+            # Collect in submission order so the summary order is stable
+            for name, future in futures:
+                try:
+                    built = future.result()
+                except Exception as e:
+                    self.error(f"{name} installer failed: {e}")
+                    built = False
+                if built:
+                    platforms_built.append(name)
+                else:
+                    overall_success = False
+        
+        return platforms_built, overall_success
+    
+    def find_installers(self) -> List[Tuple[Path, int]]:
+        """Return (path, size) for each installer under out/"""
+        installers = []
+        stack = [str(self.dist_path)]
+        while stack:
+            # Other forge processes may be rewriting out/ while we walk it
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name.lower()
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in SKIPPED_ARTIFACT_DIRS and not name.endswith('.asar.unpacked'):
+                                stack.append(entry.path)
+                        elif name.endswith(INSTALLER_EXTENSIONS) and entry.is_file():
+                            try:
+                                size = entry.stat().st_size
+                            except FileNotFoundError:
+                                continue
+                            installers.append((Path(entry.path), size))
+            except FileNotFoundError:
+                continue
+        return installers
+    
     def _show_build_artifacts(self, platform_name: str):
         """Show the created build artifacts"""
         if self.dist_path.exists():
-            artifacts = list(self.dist_path.rglob("*"))
-            installers = [f for f in artifacts if f.is_file() and any(
-                ext in f.suffix.lower() for ext in ['.exe', '.dmg', '.deb', '.rpm', '.appimage', '.zip']
-            )]
+            installers = self.find_installers()
             
             if installers:
                 self.success(f"Build artifacts for {platform_name}:")
-                for installer in installers:
-                    size_mb = installer.stat().st_size / (1024 * 1024)
+                for installer, size in installers:
+                    size_mb = size / (1024 * 1024)
                     self.info(f"  📦 {installer.name} ({size_mb:.1f} MB)")
                     self.info(f"     Path: {installer}")
     
@@ -369,18 +653,21 @@ Examples:
     print("=" * 40)
     print(f"{Colors.ENDC}")
     
-    # Check prerequisites
-    if not builder.check_prerequisites():
-        sys.exit(1)
+    # Clean if requested, overlapping the deletion with the npm checks/install
+    clean_thread = None
+    clean_result = []
+    if args.clean:
+        clean_thread = threading.Thread(target=lambda: clean_result.append(builder.clean_build()))
+        clean_thread.start()
     
-    # Install dependencies if requested
-    if args.install_deps:
-        if not builder.install_dependencies():
-            sys.exit(1)
+    # Check prerequisites (--install-deps forces a reinstall)
+    if not builder.check_prerequisites(force_install=args.install_deps):
+        sys.exit(1)
     
-    # Clean if requested
-    if args.clean:
-        if not builder.clean_build():
+    # The build writes into the cleaned directories, so wait for the clean
+    if clean_thread:
+        clean_thread.join()
+        if not clean_result or not clean_result[0]:
             sys.exit(1)
     
     # Build application
@@ -389,26 +676,11 @@ Examples:
         sys.exit(1)
     
     # Build installers
-    platforms_built = []
-    overall_success = True
-    
-    if args.all or args.windows:
-        if builder.create_installer_windows():
-            platforms_built.append("Windows")
-        else:
-            overall_success = False
-    
-    if args.all or args.macos:
-        if builder.create_installer_macos():
-            platforms_built.append("macOS")
-        else:
-            overall_success = False
-    
-    if args.all or args.linux:
-        if builder.create_installer_linux():
-            platforms_built.append("Linux")
-        else:
-            overall_success = False
+    platforms_built, overall_success = builder.create_installers(
+        windows=args.all or args.windows,
+        macos=args.all or args.macos,
+        linux=args.all or args.linux
+    )
     
     # Show summary
     builder.show_summary(platforms_built, overall_success)
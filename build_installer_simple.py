@@ -6,13 +6,10 @@ Interactive script to build FlowGenius installers without command-line arguments
 Just run: python build_installer_simple.py
 """
 
-import os
 import sys
-import subprocess
-import json
 import time
-from pathlib import Path
-import platform
+
+from build_installer import FlowGeniusBuilder
 
 def print_header():
     """Print the application header"""
@@ -33,47 +30,15 @@ def print_info(message):
     """Print info message"""
     print(f"ℹ️  {message}")
 
-def check_prerequisites():
+def check_prerequisites(builder):
     """Check if prerequisites are met"""
     print_info("Checking prerequisites...")
     
     # Check Python
     print_success(f"Python version: {sys.version.split()[0]}")
     
-    # Check Node.js/npm
-    try:
-        result = subprocess.run(['npm', '--version'], capture_output=True, text=True, check=True)
-        print_success(f"npm version: {result.stdout.strip()}")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print_error("npm not found. Please install Node.js from https://nodejs.org/")
-        return False
-    
-    # Check package.json
-    if not Path("package.json").exists():
-        print_error("package.json not found. Make sure you're in the FlowGenius directory.")
-        return False
-    
-    # Check node_modules
-    if not Path("node_modules").exists():
-        print_info("node_modules not found. Installing dependencies...")
-        if not run_command(['npm', 'install'], "Installing dependencies"):
-            return False
-    
-    print_success("All prerequisites met!")
-    return True
-
-def run_command(command, description):
-    """Run a command and return success status"""
-    print_info(f"Running: {description}")
-    try:
-        result = subprocess.run(command, check=True, capture_output=True, shell=True, encoding='utf-8', errors='ignore')
-        print_success(f"Completed: {description}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print_error(f"Failed: {description}")
-        if e.stderr:
-            print(f"Error: {e.stderr}")
-        return False
+    # npm, package.json and node_modules are checked by the full builder
+    return builder.check_prerequisites()
 
 def show_menu():
     """Display the main menu"""
@@ -87,67 +52,22 @@ def show_menu():
     print("6. 🚪 Exit")
     print()
 
-def clean_build():
-    """Clean previous build artifacts"""
-    print_info("Cleaning previous build artifacts...")
-    
-    dirs_to_clean = ["out", "dist", ".webpack"]
-    for dir_name in dirs_to_clean:
-        dir_path = Path(dir_name)
-        if dir_path.exists():
-            import shutil
-            shutil.rmtree(dir_path)
-            print_success(f"Removed {dir_name}/")
-    
-    return True
-
-def build_app():
-    """Build the application"""
-    return run_command(['npm', 'run', 'build'], "Building application")
-
-def create_windows_installer():
-    """Create Windows installer"""
-    return run_command(['npm', 'run', 'make:win'], "Creating Windows installer")
-
-def create_all_installers():
+def create_all_installers(builder):
     """Create installers for all platforms"""
-    success = True
-    
-    # Windows
-    if not run_command(['npm', 'run', 'make:win'], "Creating Windows installer"):
-        success = False
-    
-    # macOS (may fail on non-Mac systems, that's OK)
     print_info("Attempting macOS build (may fail on non-Mac systems)...")
-    try:
-        subprocess.run(['npm', 'run', 'make:mac'], check=True, capture_output=True, text=True)
-        print_success("macOS installer created")
-    except subprocess.CalledProcessError:
-        print_info("macOS build skipped (requires macOS)")
     
-    # Linux
-    if not run_command(['npm', 'run', 'make:linux'], "Creating Linux installer"):
-        success = False
+    platforms_built, _ = builder.create_installers(
+        windows=True, macos=True, linux=True, macos_best_effort=True
+    )
     
-    return success
+    # macOS is best effort; Windows and Linux must both succeed
+    return "Windows" in platforms_built and "Linux" in platforms_built
 
-def show_build_results():
-    """Show the generated build artifacts"""
-    out_dir = Path("out")
+def show_build_results(builder):
+    """Show where the build artifacts were written"""
+    out_dir = builder.dist_path
     if out_dir.exists():
-        print()
-        print_success("Build completed! Generated files:")
-        
-        installers = list(out_dir.rglob("*.exe")) + list(out_dir.rglob("*.dmg")) + list(out_dir.rglob("*.AppImage"))
-        
-        if installers:
-            for installer in installers:
-                size_mb = installer.stat().st_size / (1024 * 1024)
-                print(f"  📦 {installer.name} ({size_mb:.1f} MB)")
-                print(f"     Path: {installer}")
-        else:
-            print_info("No installer files found in out/ directory")
-        
+        # Each installer step already listed its artifacts
         print()
         print_info(f"All files are in the 'out' directory: {out_dir.absolute()}")
     else:
@@ -178,8 +98,10 @@ def main():
     """Main application loop"""
     print_header()
     
+    builder = FlowGeniusBuilder(verbose=False)
+    
     # Check prerequisites
-    if not check_prerequisites():
+    if not check_prerequisites(builder):
         print()
         input("Press Enter to exit...")
         sys.exit(1)
@@ -201,25 +123,25 @@ def main():
         if choice == "1":
             print()
             print_info("Building Windows installer...")
-            if build_app() and create_windows_installer():
+            if builder.build_app() and builder.create_installer_windows():
                 success = True
         
         elif choice == "2":
             print()
             print_info("Building for all platforms...")
-            if build_app() and create_all_installers():
+            if builder.build_app() and create_all_installers(builder):
                 success = True
         
         elif choice == "3":
             print()
             print_info("Clean build for Windows...")
-            if clean_build() and build_app() and create_windows_installer():
+            if builder.clean_build() and builder.build_app() and builder.create_installer_windows():
                 success = True
         
         elif choice == "4":
             print()
             print_info("Clean build for all platforms...")
-            if clean_build() and build_app() and create_all_installers():
+            if builder.clean_build() and builder.build_app() and create_all_installers(builder):
                 success = True
         
         elif choice == "5":
@@ -241,7 +163,7 @@ def main():
         print("="*50)
         if success:
             print_success(f"Build completed in {build_time:.1f} seconds! 🎉")
-            show_build_results()
+            show_build_results(builder)
         else:
             print_error("Build failed. Check the errors above.")
         print("="*50)